@@ -3697,6 +3697,7 @@ ECA_WIN32SIGN = ["-Wno-error"] if WIN32 else []
 toggle_packages(client_ENABLED or server_ENABLED, "xpra.net.protocol", "xpra.net.control")
 toggle_packages(websockets_ENABLED, "xpra.net.websockets", "xpra.net.websockets.headers")
 tace(websockets_ENABLED, "xpra.net.websockets.mask", optimize=3, extra_compile_args=ECA_WIN32SIGN)
+tace(websockets_ENABLED, "xpra.net.websockets.cyheader", optimize=3, extra_compile_args=ECA_WIN32SIGN)
 toggle_packages(rencodeplus_ENABLED, "xpra.net.rencodeplus.rencodeplus")
 tace(rencodeplus_ENABLED, "xpra.net.rencodeplus.rencodeplus", optimize=3)
 toggle_packages(brotli_ENABLED, "xpra.net.brotli")
@@ -5,6 +5,7 @@
 # later version. See the file COPYING for details.
 
 import io
+import os
 import socket
 import unittest
 from unittest.mock import MagicMock
@@ -334,6 +335,24 @@ class TestLogNewConnection(unittest.TestCase):
         log_new_connection(conn)
 
 
+# ---------------------------------------------------------------------------
+# TwoFileConnection
+# ---------------------------------------------------------------------------
+
+class TestTwoFileConnection(unittest.TestCase):
+
+    @unittest.skipUnless(hasattr(os, "writev"), "os.writev is not available")
+    def test_writev(self):
+        from xpra.net.bytestreams import TwoFileConnection
+        rfd, wfd = os.pipe()
+        with os.fdopen(rfd, "rb", 0) as readable, os.fdopen(wfd, "wb", 0) as writeable:
+            conn = TwoFileConnection(writeable, readable, socktype="pipe")
+            written = conn.writev([b"header", memoryview(b"payload")])
+            self.assertEqual(written, 13)
+            self.assertEqual(conn.output_bytecount, 13)
+            self.assertEqual(os.read(rfd, 64), b"headerpayload")
+
+
 def main():
     unittest.main()
 
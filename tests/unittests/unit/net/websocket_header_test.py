@@ -6,7 +6,7 @@
 
 import unittest
 
-from xpra.net.websockets.header import encode_hybi_header, decode_hybi
+from xpra.net.websockets.header import encode_hybi_header, encode_binary_header, decode_hybi, close_packet
 from xpra.log import Logger
 
 log = Logger("network")
@@ -46,6 +46,30 @@ class WebsocketHeaderTest(unittest.TestCase):
                         v = decode_hybi(wsdata[:int(has_mask)*4+i])
                         assert v is None, "got %s" % (v,)
 
+    def test_zero_mask(self):
+        payload = b"hello"
+        wsdata = encode_hybi_header(2, len(payload), True, True) + b"\0"*4 + payload
+        opcode, rpayload, rlen, fin = decode_hybi(wsdata)
+        assert opcode == 2 and fin
+        assert rpayload == payload
+        assert rlen == len(wsdata)
+
+    def test_binary_header(self):
+        for l in (0, 10, 125, 126, 65535, 65536, 2**32):
+            assert encode_binary_header(l) == encode_hybi_header(2, l)
+
+    def test_close_packet(self):
+        for reason in ("", "bye", "x" * 200, "é" * 100):
+            packet = close_packet(1001, reason)
+            opcode, payload, length, fin = decode_hybi(packet)
+            assert opcode == 8 and fin
+            assert length == len(packet) <= 127
+            payload = bytes(payload)
+            assert payload[:2] == b"\x03\xe9"
+            rstr = payload[2:].decode("utf-8")
+            assert reason.startswith(rstr)
+        assert close_packet(1000, "é" * 100)[4:] == ("é" * 61).encode("utf-8")
+
     def test_invalid_opcode(self):
         self.assertRaises(ValueError, encode_hybi_header, 0xFF, 0)
 
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# This file is part of Xpra.
+# Copyright (C) 2026 Antoine Martin <antoine@xpra.org>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import os
+import tempfile
+import unittest
+
+from xpra.notification.base import NotifierBase
+
+
+class TestNotifierBase(unittest.TestCase):
+
+    def test_cleanup(self):
+        nb = NotifierBase()
+        filenames = []
+        for nid in range(3):
+            fd, filename = tempfile.mkstemp(prefix="xpra-notification-test-")
+            os.close(fd)
+            nb.temp_files[nid] = filename
+            filenames.append(filename)
+        # already gone:
+        nb.temp_files[3] = filenames[0] + "-missing"
+        nb.cleanup()
+        assert not nb.temp_files
+        for filename in filenames:
+            assert not os.path.exists(filename), f"{filename!r} was not removed"
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# This file is part of Xpra.
+# Copyright (C) 2026 Antoine Martin <antoine@xpra.org>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import unittest
+
+from xpra.server.window.filters import get_window_filter, WindowPropertyIn, WindowPropertyNotIn
+
+
+class FakeWindow:
+
+    def __init__(self, **props):
+        self.props = props
+
+    def get_property(self, prop):
+        return self.props[prop]
+
+
+class TestFilters(unittest.TestCase):
+
+    def test_equal(self):
+        wf = get_window_filter("window", "title", "=", "foo")
+        assert wf.matches(FakeWindow(title="foo"))
+        assert not wf.matches(FakeWindow(title="bar"))
+        # missing property:
+        assert not wf.matches(FakeWindow())
+
+    def test_not_equal(self):
+        wf = get_window_filter("window", "title", "!=", "foo")
+        assert not wf.matches(FakeWindow(title="foo"))
+        assert wf.matches(FakeWindow(title="bar"))
+
+    def test_coerce(self):
+        wf = get_window_filter("window", "pid", "=", "10")
+        assert wf.matches(FakeWindow(pid=10))
+        wf = get_window_filter("window", "pid", "=", 10)
+        assert wf.matches(FakeWindow(pid=10))
+        assert not wf.matches(FakeWindow(pid="10"))
+
+    def test_unhashable(self):
+        wf = get_window_filter("window", "class-instance", "=", ("a", "b"))
+        assert wf.matches(FakeWindow(**{"class-instance": ("a", "b")}))
+        assert not wf.matches(FakeWindow(**{"class-instance": ["a", "c"]}))
+
+    def test_list_value(self):
+        wf = get_window_filter("window", "class-instance", "=", ["a", "b"])
+        assert wf.matches(FakeWindow(**{"class-instance": ["a", "b"]}))
+        assert not wf.matches(FakeWindow(**{"class-instance": ["a", "c"]}))
+        wf = get_window_filter("window", "class-instance", "!=", ["a", "b"])
+        assert not wf.matches(FakeWindow(**{"class-instance": ["a", "b"]}))
+        assert wf.matches(FakeWindow(**{"class-instance": ["a", "c"]}))
+
+    def test_multiple_values(self):
+        wf = WindowPropertyIn("title", ["foo", "bar"])
+        assert wf.matches(FakeWindow(title="bar"))
+        assert not wf.matches(FakeWindow(title="baz"))
+        wf = WindowPropertyNotIn("title", ["foo", "bar"])
+        assert not wf.matches(FakeWindow(title="bar"))
+        assert wf.matches(FakeWindow(title="baz"))
+
+    def test_unhashable_filter_value(self):
+        wf = WindowPropertyIn("class-instance", [["a", "b"]])
+        assert wf.matches(FakeWindow(**{"class-instance": ["a", "b"]}))
+        assert not wf.matches(FakeWindow(**{"class-instance": ["a", "c"]}))
+        wf = WindowPropertyNotIn("class-instance", [["a", "b"]])
+        assert not wf.matches(FakeWindow(**{"class-instance": ["a", "b"]}))
+        assert wf.matches(FakeWindow(**{"class-instance": ["a", "c"]}))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            get_window_filter("foo", "title", "=", "bar")
+        with self.assertRaises(ValueError):
+            get_window_filter("window", "title", "~", "bar")
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -124,6 +124,7 @@ class AudioSubprocess(SubprocessCallee):
                 wo.cleanup()
             except RuntimeError:
                 log("cleanup() failed to clean %s", wo, exc_info=True)
+        super().cleanup()
         GLib.timeout_add(1000, self.do_stop)
 
     def export_info(self) -> bool:
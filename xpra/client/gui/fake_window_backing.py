@@ -7,9 +7,12 @@
 from typing import Any
 
 from xpra.client.gui.window.backing import fire_paint_callbacks
+from xpra.os_util import gi_import
 from xpra.util.env import envint
 from xpra.log import Logger
 
+GLib = gi_import("GLib")
+
 log = Logger("window", "fake")
 
 FAKE_BACKING_DELAY = envint("XPRA_FAKE_BACKING_DELAY", 5)
@@ -45,8 +48,6 @@ class FakeBacking:
 
     def draw_region(self, _x, _y, _width, _height, _coding, _img_data, _rowstride, _options, callbacks):
         log("draw_region(..) faking it after %sms", self.fake_delay)
-        from xpra.os_util import gi_import
-        GLib = gi_import("GLib")
         GLib.timeout_add(self.fake_delay, fire_paint_callbacks, callbacks, True)
 
     def cairo_draw(self, context, x, y):
@@ -8,6 +8,7 @@ import uuid
 import signal
 from typing import Any
 from time import monotonic
+from collections import deque
 from collections.abc import Callable
 
 from tkinter import Tk
@@ -35,9 +36,12 @@ class TkScheduler:
 
     @staticmethod
     def timeout_add(delay: int, fn: Callable, *args, **kwargs):
+        if not kwargs:
+            # `after` passes positional arguments through, no need for a wrapper:
+            return app.after(delay, fn, *args)
 
         def call() -> None:
-            log(f"calling {fn}")
+            log("calling %s", fn)
             fn(*args, **kwargs)
         return app.after(delay, call)
 
@@ -48,9 +52,20 @@ class XpraTkClient:
         self.windows: dict[int, Any] = {}
         self.hello = {}
         self.focused = 0
-        self._ordinary_packets = []
+        self._focus_after_id = None
+        self._ordinary_packets: deque[Packet] = deque()
         self.protocol = None
         self.have_more = noop
+        self._packet_handlers: dict[str, Callable[[Packet], None]] = {}
+        self._build_packet_dispatch()
+
+    def _build_packet_dispatch(self) -> None:
+        # map wire packet types to their `_process_*` handler, once:
+        prefix = "_process_"
+        for name in dir(self):
+            if name.startswith(prefix):
+                packet_type = sys.intern(name[len(prefix):].replace("_", "-"))
+                self._packet_handlers[packet_type] = getattr(self, name)
 
     def run(self) -> int:
         app.mainloop()
@@ -104,26 +119,22 @@ class XpraTkClient:
         # data = dumps(packet)
         # header = pack_header(FLAGS_RENCODEPLUS, 0, 0, len(data))
         # bin_packet = header+data
-        netlog(f"sent {packet_type!r}: {packet!r}")
+        netlog("sent %r: %r", packet_type, packet)
         self._ordinary_packets.append(packet)
         self.have_more()
 
     def next_packet(self) -> tuple[Packet, bool, bool]:
-        packet = self._ordinary_packets.pop(0)
+        packet = self._ordinary_packets.popleft()
         return packet, True, bool(self._ordinary_packets)
 
     def process_packet(self, _protocol, packet: Packet) -> None:
         packet_type = packet.get_type()
-        packet_type_fn_name = packet_type.replace("-", "_")
-        meth = getattr(self, f"_process_{packet_type_fn_name}", None)
+        meth = self._packet_handlers.get(packet_type)
         if not meth:
             netlog.warn(f"Warning: missing handler for {packet_type!r}")
             netlog("packet=%r", packet)
             return
-
-        def call_handler() -> None:
-            meth(packet)
-        app.after(0, call_handler)
+        app.after(0, meth, packet)
 
     def _process_connection_close(self, packet: Packet):
         self.quit(0)
@@ -187,9 +198,9 @@ class XpraTkClient:
         packet_sequence = packet.get_u64(8)
         rowstride = packet.get_u32(9)
         window = self.windows.get(wid)
-        now = monotonic()
         if window:
             message = ""
+            now = monotonic()
             window.draw(x, y, width, height, coding, data, rowstride)
             decode_time = int(1000 * (monotonic() - now))
         else:
@@ -208,11 +219,14 @@ class XpraTkClient:
         if self.focused == wid:
             return
         self.focused = wid
+        if self._focus_after_id is not None:
+            app.after_cancel(self._focus_after_id)
+        self._focus_after_id = app.after(10, self._recheck_focus, wid)
 
-        def recheck_focus() -> None:
-            if self.focused == wid:
-                self.send(WINDOW_FOCUS, wid, ())
-        app.after(10, recheck_focus)
+    def _recheck_focus(self, wid: int) -> None:
+        self._focus_after_id = None
+        if self.focused == wid:
+            self.send(WINDOW_FOCUS, wid, ())
 
 
 def make_client() -> XpraTkClient:
@@ -10,7 +10,7 @@ from PIL import Image, ImageTk
 
 from xpra.net.common import BACKWARDS_COMPATIBLE
 from xpra.net.packet_type import (
-    POINTER_BUTTON, POINTER_MOTION,
+    POINTER_BUTTON, POINTER_MOTION, KEYBOARD_EVENT,
     WINDOW_MAP, WINDOW_UNMAP, WINDOW_CLOSE, WINDOW_CONFIGURE,
 )
 from xpra.util.objects import typedict
@@ -75,18 +75,18 @@ class ClientWindow(Toplevel):
         if "title" in metadata:
             self.title(metadata.strget("title"))
         else:
-            log(f"unused window metadata {self.wid:#x}: {metadata}")
+            log("unused window metadata %#x: %s", self.wid, metadata)
 
     def show(self) -> None:
         self.deiconify()
 
     def on_focus_in(self, event) -> None:
-        log(f"focus-in: {event!r}")
+        log("focus-in: %r", event)
         self.client.update_focus(self.wid)
 
     @staticmethod
     def on_focus_out(event) -> None:
-        log(f"focus_out: {event!r}")
+        log("focus_out: %r", event)
         # no real need to update anything
         # (tracking where the focus is actually going to would add the same complexity as the Gtk client)
 
@@ -94,11 +94,11 @@ class ClientWindow(Toplevel):
         self.client.send(WINDOW_UNMAP, self.wid)
 
     def on_key_press(self, event) -> None:
-        log(f"key press: {event!r}")
+        log("key press: %r", event)
         self.on_key(True, event)
 
     def on_key_release(self, event) -> None:
-        log(f"key release: {event!r}")
+        log("key release: %r", event)
         self.on_key(False, event)
 
     def on_key(self, pressed: bool, event) -> None:
@@ -111,25 +111,25 @@ class ClientWindow(Toplevel):
             group = 0
             self.client.send("key-action", self.wid, keyname, pressed, mods, keyval, string, keycode, group)
         else:
-            self.client.send("keyboard-event", self.wid, keyname, pressed, {
+            self.client.send(KEYBOARD_EVENT, self.wid, keyname, pressed, {
                 "string": string,
                 "keycode": keycode,
                 "backend": "tk",
             })
 
     def on_mouse_motion(self, event) -> None:
-        log(f"mouse motion: {event!r}")
+        log("mouse motion: %r", event)
         device_id = -1
         seq = 0
         pos = (event.x, event.y)
         self.client.send(POINTER_MOTION, device_id, seq, self.wid, pos, {})
 
     def on_mouse_button_press(self, event) -> None:
-        log(f"mouse button press: {event!r}")
+        log("mouse button press: %r", event)
         self.on_mouse_button_event(True, event)
 
     def on_mouse_button_release(self, event) -> None:
-        log(f"mouse button release: {event!r}")
+        log("mouse button release: %r", event)
         self.on_mouse_button_event(False, event)
 
     def on_mouse_button_event(self, pressed: bool, event) -> None:
@@ -139,7 +139,7 @@ class ClientWindow(Toplevel):
         self.client.send(POINTER_BUTTON, -1, seq, self.wid, button, pressed, pos, {})
 
     def on_map(self, event) -> None:
-        log(f"map: {event!r}")
+        log("map: %r", event)
         x = self.winfo_x()
         y = self.winfo_y()
         w = self.winfo_width()
@@ -150,7 +150,7 @@ class ClientWindow(Toplevel):
         self.client.send(WINDOW_CLOSE, self.wid)
 
     def on_configure(self, event) -> None:
-        log(f"configure: {event}")
+        log("configure: %s", event)
         self.client.send(WINDOW_CONFIGURE, self.wid, {
             "geometry": (event.x, event.y, event.width, event.height),
         })
@@ -22,6 +22,7 @@ class WindowsMessageSource(GLib.Source):
     def __init__(self):
         super().__init__()
         self.msg = MSG()
+        self.pmsg = byref(self.msg)
         self.main_loop = None
         # Set high priority so Windows messages are processed promptly
         self.set_priority(GLib.PRIORITY_HIGH)
@@ -32,7 +33,7 @@ class WindowsMessageSource(GLib.Source):
         # Return (ready, timeout)
         # timeout=-1 means wait indefinitely, 0 means don't wait
         has_message = PeekMessageW(
-            byref(self.msg),
+            self.pmsg,
             None,  # All windows
             0, 0,  # All messages
             win32con.PM_NOREMOVE  # Don't remove from queue
@@ -45,7 +46,7 @@ class WindowsMessageSource(GLib.Source):
     def check(self):
         """Check if source is ready to dispatch"""
         has_message = PeekMessageW(
-            byref(self.msg),
+            self.pmsg,
             None,
             0, 0,
             win32con.PM_NOREMOVE
@@ -60,7 +61,7 @@ class WindowsMessageSource(GLib.Source):
         """
         max_messages = 5
         processed = 0
-        pmsg = byref(self.msg)
+        pmsg = self.pmsg
         while processed < max_messages and PeekMessageW(pmsg, None, 0, 0, win32con.PM_REMOVE):
             msgid = self.msg.message
             # log("dispatch message=%s", WM_MESSAGES.get(msgid, msgid))
@@ -81,17 +82,18 @@ class WindowsMessageSource(GLib.Source):
 def process_windows_messages():
     """Process Windows messages - called by GLib timer"""
     msg = MSG()
+    pmsg = byref(msg)
     processed = 0
     max_per_call = 5
 
-    while processed < max_per_call and PeekMessageW(byref(msg), None, 0, 0, win32con.PM_REMOVE):
+    while processed < max_per_call and PeekMessageW(pmsg, None, 0, 0, win32con.PM_REMOVE):
         msgid = msg.message
         # log("Timer dispatch: %s", WM_MESSAGES.get(msgid, msgid))
         if msgid == win32con.WM_QUIT:
             return False  # Stop timer
 
-        TranslateMessage(byref(msg))
-        DispatchMessageW(byref(msg))
+        TranslateMessage(pmsg)
+        DispatchMessageW(pmsg)
         processed += 1
 
     return True  # Continue timer
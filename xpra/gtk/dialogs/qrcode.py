@@ -30,7 +30,7 @@ def show_qr(uri: str, width: int = 640, height: int = 640):
     pixbuf = qr_pixbuf(uri, width, height)
     if not pixbuf:
         return
-    image = Gtk.Image().new_from_pixbuf(pixbuf)
+    image = Gtk.Image.new_from_pixbuf(pixbuf)
     window = Gtk.Window(modal=True, title="QR Code")
     window.set_position(Gtk.WindowPosition.CENTER)
     window.add(image)
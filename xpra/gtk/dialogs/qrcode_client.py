@@ -4,13 +4,13 @@
 # later version. See the file COPYING for details.
 
 import sys
-from typing import Any
 
 from xpra.common import noerr
 from xpra.util.objects import typedict
 from xpra.util.env import envbool
 from xpra.os_util import gi_import
 from xpra.util.system import SIGNAMES
+from xpra.util.thread import start_thread
 from xpra.util.str_fn import bytestostr
 from xpra.exit_codes import ExitCode, ExitValue
 from xpra.gtk.window import add_close_accel
@@ -31,18 +31,29 @@ GLib = gi_import("GLib")
 log = Logger("client", "util")
 
 IPV6 = envbool("XPRA_IPV6", False)
+LOOPBACK_PREFIXES = ("127.0.0.", "::1")
 
 inject_css_overrides()
 
 
-def dpath(caps: typedict, *path) -> Any:
-    d: typedict = caps
+def dpath(caps: typedict, *path) -> typedict | None:
+    d: dict = caps
     for x in path:
-        val = d.dictget(x)
-        if not val:
+        d = dict.get(d, x)
+        if not d or not isinstance(d, dict):
             return None
-        d = typedict(val)
-    return d
+    # only wrap the leaf:
+    return typedict(d)
+
+
+def format_uri(host: str, port: int, socktypes: list[str]) -> str:
+    if "ws" in socktypes:
+        if port == 80:
+            return f"http://{host}/"
+        return f"http://{host}:{port}/"
+    if port == 443:
+        return f"https://{host}/"
+    return f"https://{host}:{port}/"
 
 
 class QRCodeClient(InfoXpraClient):
@@ -66,9 +77,9 @@ class QRCodeClient(InfoXpraClient):
                 except (ValueError, IndexError):
                     continue
                 host = bytestostr(host)
-                if host.startswith("127.0.0.") or host.startswith("::1"):
+                if host.startswith(LOOPBACK_PREFIXES):
                     continue
-                if host.find(":") >= 0:
+                if ":" in host:
                     if IPV6:
                         host = "[%s]" % host
                     else:
@@ -76,21 +87,18 @@ class QRCodeClient(InfoXpraClient):
                 addr_types.setdefault((host, port), []).append(socktype)
         log("addr_types=%s", addr_types)
         if addr_types:
-            uris = []
-            for addr, socktypes in addr_types.items():
-                host, port = addr
-                proto = "http" if "ws" in socktypes else "https"
-                if (proto == "http" and port == 80) or (proto == "https" and port == 443):
-                    uri = "%s://%s/" % (proto, host)
-                else:
-                    uri = "%s://%s:%i/" % (proto, host, port)
-                uris.append(uri)
-
-            def show_addresses() -> None:
-                w = QRCodeWindow(uris)
+            uris = [format_uri(host, port, socktypes) for (host, port), socktypes in addr_types.items()]
+
+            def show_addresses(pixbufs: list) -> None:
+                w = QRCodeWindow(uris, pixbufs)
                 w.show_all()
 
-            GLib.idle_add(show_addresses)
+            def generate_qrcodes() -> None:
+                # encoding the qrcodes can be slow, keep it off the main thread:
+                pixbufs = [qr_pixbuf(uri, width=360, height=360) for uri in uris]
+                GLib.idle_add(show_addresses, pixbufs)
+
+            start_thread(generate_qrcodes, "qrcode-pixbufs", daemon=True)
         else:
             noerr(sys.stdout.write, "no addresses found")
             noerr(sys.stdout.flush)
@@ -115,7 +123,7 @@ class QRCodeClient(InfoXpraClient):
 
 class QRCodeWindow(Gtk.Window):
 
-    def __init__(self, uris):
+    def __init__(self, uris, pixbufs):
         self.exit_code = None
         super().__init__(type=Gtk.WindowType.TOPLEVEL)
         self.connect("delete_event", self.exit)
@@ -128,11 +136,10 @@ class QRCodeWindow(Gtk.Window):
         if icon:
             self.set_icon(icon)
         hbox = Gtk.HBox(homogeneous=True, spacing=20)
-        for uri in uris:
+        for uri, pixbuf in zip(uris, pixbufs):
             vbox = Gtk.VBox(homogeneous=False, spacing=10)
             vbox.add(label(uri))
-            pixbuf = qr_pixbuf(uri, width=360, height=360)
-            image = Gtk.Image().new_from_pixbuf(pixbuf)
+            image = Gtk.Image.new_from_pixbuf(pixbuf)
             vbox.add(image)
             hbox.add(vbox)
         self.add(hbox)
@@ -5,12 +5,11 @@
 # later version. See the file COPYING for details.
 
 import sys
-import glob
+import binascii
 import os.path
 
 from xpra.util.env import osexpand
 from xpra.util.io import load_binary_file, use_gui_prompt
-from xpra.util.str_fn import hexstr
 from xpra.platform.paths import get_user_conf_dirs
 from xpra.log import Logger, consume_verbose_argv
 
@@ -58,26 +57,37 @@ def main(argv: list[str]) -> int:
 
             error = info = printmsgs
 
-        key_handle_filenames = [os.path.join(d, "u2f-keyhandle.hex") for d in get_user_conf_dirs()]
+        conf_dirs = get_user_conf_dirs()
+        key_handle_filenames = [os.path.join(d, "u2f-keyhandle.hex") for d in conf_dirs]
         assert key_handle_filenames
         for filename in key_handle_filenames:
             p = osexpand(filename)
-            key_handle_str = load_binary_file(p).rstrip(b" \n\r").decode("latin1")
-            if key_handle_str:
+            data = load_binary_file(p)
+            if not data:
+                continue
+            if data.rstrip(b" \n\r"):
                 error(" found an existing key handle in file '%s':" % p,
                       # " %s" % key_handle_str,
                       " skipping U2F registration",
                       " delete this file if you want to register again")
                 return 1
         public_key_filenames = []
-        for d in get_user_conf_dirs():
-            public_key_filenames += glob.glob(os.path.join(d, "u2f*.pub"))
+        for d in conf_dirs:
+            try:
+                it = os.scandir(osexpand(d))
+            except OSError:
+                continue
+            with it:
+                public_key_filenames += [
+                    entry.path for entry in it
+                    if entry.name.startswith("u2f") and entry.name.endswith(".pub") and entry.is_file()
+                ]
         if public_key_filenames:
             info(" found %i existing public keys" % (len(public_key_filenames)),
                  *((" - %s" % x) for x in public_key_filenames))
 
         # pick the first directory:
-        conf_dir = osexpand(get_user_conf_dirs()[0])
+        conf_dir = osexpand(conf_dirs[0])
         if not os.path.exists(conf_dir):
             os.mkdir(conf_dir)
 
@@ -103,18 +113,18 @@ def main(argv: list[str]) -> int:
         # save to files:
         key_handle_filename = osexpand(key_handle_filenames[0])
         with open(key_handle_filename, "wb") as f:
-            f.write(hexstr(key_handle).encode("latin1"))
+            f.write(binascii.hexlify(key_handle))
         # find a filename we can use for this public key:
+        existing = set(os.listdir(conf_dir))
         i = 1
         while True:
-            c = ""
-            if i > 1:
-                c = "-%i"
-            public_key_filename = os.path.join(conf_dir, "u2f%s-pub.hex" % c)
-            if not os.path.exists(public_key_filename):
+            name = "u2f-pub.hex" if i == 1 else f"u2f-{i}-pub.hex"
+            if name not in existing:
+                public_key_filename = os.path.join(conf_dir, name)
                 break
+            i += 1
         with open(public_key_filename, "wb") as f:
-            f.write(hexstr(pubkey).encode("latin1"))
+            f.write(binascii.hexlify(pubkey))
         info(
             "key handle saved to file:",
             f"{key_handle_filename!r}",
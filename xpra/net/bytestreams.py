@@ -243,6 +243,11 @@ class TwoFileConnection(Connection):
         self.may_abort("write")
         return self._write(os.write, self._write_fd, buf)
 
+    if hasattr(os, "writev"):
+        def writev(self, buffers, _packet_type: str = "") -> int:
+            self.may_abort("write")
+            return self._write(os.writev, self._write_fd, buffers)
+
     def close(self) -> None:
         log("%s.close() close callback=%s, readable=%s, writeable=%s",
             self, self._close_cb, self._readable, self._writeable)
@@ -5,11 +5,15 @@
 # later version. See the file COPYING for details.
 
 import socket
+import ipaddress
+from time import monotonic
+from threading import Lock, Thread
 from dataclasses import dataclass, field
 from zeroconf import ServiceInfo, Zeroconf, __version__ as zeroconf_version
 
 from xpra.log import Logger
 from xpra.util.env import envbool, envint, first_time
+from xpra.util.thread import start_thread
 from xpra.net.net_util import get_interfaces_addresses
 from xpra.net.mdns import XPRA_TCP_MDNS_TYPE, XPRA_UDP_MDNS_TYPE
 from xpra.net.net_util import get_iface
@@ -20,6 +24,8 @@ log("python-zeroconf version %s", zeroconf_version)
 IPV6 = envbool("XPRA_ZEROCONF_IPV6", True)
 IPV6_LO = envbool("XPRA_ZEROCONF_IPV6_LOOPBACK", False)
 IPV4_LO = envint("XPRA_ZEROCONF_IPV4_LOOPBACK", 1)
+RESOLVE_CACHE_TTL = envint("XPRA_ZEROCONF_RESOLVE_CACHE_TTL", 60)
+REGISTER_JOIN_TIMEOUT = envint("XPRA_ZEROCONF_REGISTER_JOIN_TIMEOUT", 5)
 
 LOOPBACK_AFAM: dict[str, socket.AddressFamily] = {
     "0.0.0.0": socket.AddressFamily.AF_INET,
@@ -27,11 +33,57 @@ LOOPBACK_AFAM: dict[str, socket.AddressFamily] = {
 }
 
 
+# host -> interface name,
+# there is no network change notification to invalidate this cache,
+# so it lives for the whole process:
+# a listen address is not expected to move to a different interface
+iface_cache: dict[str, str] = {}
+
+
 def get_interface_index(host: str) -> str:
     # we don't use interface numbers with zeroconf,
     # so just return the interface name,
     # which is also unique
-    return get_iface(host)
+    iface = iface_cache.get(host)
+    if iface is None:
+        iface = iface_cache[host] = get_iface(host)
+    return iface
+
+
+# hostname -> (address, expiry), shared by all the publishers:
+resolve_cache: dict[str, tuple[str, float]] = {}
+
+
+def resolve_host(host: str) -> str:
+    try:
+        ipaddress.ip_address(host)
+        # already a literal address:
+        return host
+    except ValueError:
+        pass
+    now = monotonic()
+    cached = resolve_cache.get(host)
+    if cached and cached[1] > now:
+        return cached[0]
+    try:
+        addr = socket.gethostbyname(host)
+    except OSError:
+        addr = host
+    resolve_cache[host] = (addr, now + RESOLVE_CACHE_TTL)
+    return addr
+
+
+# services advertised on the same interfaces can share the same `Zeroconf` instance:
+zeroconf_instances: dict[tuple[str, ...], Zeroconf] = {}
+
+
+def get_zeroconf(hosts: list[str]) -> Zeroconf:
+    key = tuple(sorted(hosts))
+    zc = zeroconf_instances.get(key)
+    if zc is None:
+        zc = Zeroconf(interfaces=list(key))
+        zeroconf_instances[key] = zc
+    return zc
 
 
 def inet_ton(af, addr):
@@ -42,13 +94,7 @@ def inet_ton(af, addr):
 
 def txt_rec(text_dict) -> dict:
     # prevent zeroconf from mangling our ints into booleans:
-    new_dict = {}
-    for k, v in text_dict.items():
-        if isinstance(v, int):
-            new_dict[k] = str(v)
-        else:
-            new_dict[k] = v
-    return new_dict
+    return {k: str(v) if isinstance(v, int) else v for k, v in text_dict.items()}
 
 
 @dataclass
@@ -63,6 +109,10 @@ class Service:
     service: ServiceInfo
     zeroconf: Zeroconf | None = field(default=None)
     registered: bool = field(default=False)
+    # the thread running `register_service`:
+    thread: Thread | None = field(default=None)
+    # TXT properties received before the registration completed:
+    pending_txt: dict | None = field(default=None)
 
 
 class ZeroconfMulticast:
@@ -79,6 +129,11 @@ class ZeroconfMulticast:
         self.ports: dict[str, set[int]] = {}
         # group addresses that only differ by their interface into a single record:
         self.services_by_name: dict[str, Service] = {}
+        # the TXT properties we last advertised:
+        self.properties = txt_rec(text_dict or {})
+        # synchronizes the registration threads with `update_txt` and `stop`,
+        # so that TXT updates are applied in order:
+        self.lock = Lock()
 
         def add_address(host: str, port: int, af: socket.AddressFamily) -> None:
             self.add_address(host, port, af, service_name, service_type, text_dict)
@@ -123,7 +178,7 @@ class ZeroconfMulticast:
             if host == "":
                 host = "127.0.0.1"
             af = socket.AF_INET
-            if host.find(":") >= 0:
+            if ":" in host:
                 if IPV6:
                     af = socket.AF_INET6
                 else:
@@ -133,12 +188,9 @@ class ZeroconfMulticast:
     def add_address(self, host: str, port: int, af: socket.AddressFamily,
                     service_name: str, service_type: str, text_dict):
         try:
-            if af == socket.AF_INET6 and host.find("%"):
-                host = host.split("%")[0]
-            try:
-                host = socket.gethostbyname(host)
-            except OSError:
-                pass
+            if af == socket.AF_INET6 and "%" in host:
+                host = host.split("%", 1)[0]
+            host = resolve_host(host)
             address = inet_ton(af, host)
         except Exception as e:
             log("inet_aton(%s)", host, exc_info=True)
@@ -199,46 +251,103 @@ class ZeroconfMulticast:
     def start(self) -> None:
         for s in self.services:
             try:
-                s.zeroconf = Zeroconf(interfaces=s.hosts)
+                s.zeroconf = get_zeroconf(s.hosts)
             except OSError:
                 log("start()", exc_info=True)
                 log.error("Error: failed to create Zeroconf instance for addresses %s", s.hosts)
                 continue
-            try:
-                s.zeroconf.register_service(s.service)
-            except Exception:
-                log("start failed on %s", s.service, exc_info=True)
-            else:
+            # registering waits for the probes and announcements to complete,
+            # so don't block the caller's thread with it:
+            s.thread = start_thread(self.register, f"zeroconf-register-{s.service.name}", daemon=True, args=(s, ))
+
+    def register(self, s: Service) -> None:
+        with self.lock:
+            zc = s.zeroconf
+            if not zc:
+                return
+            # the properties may have been updated before we got here:
+            txt = s.pending_txt
+            s.pending_txt = None
+            if txt is not None:
+                s.kwargs["properties"] = txt
+                s.service = ServiceInfo(**s.kwargs)
+        try:
+            zc.register_service(s.service)
+        except Exception:
+            log("start failed on %s", s.service, exc_info=True)
+            return
+        with self.lock:
+            stopped = s.zeroconf is None
+            if not stopped:
                 s.registered = True
+                txt = s.pending_txt
+                s.pending_txt = None
+                if txt is not None:
+                    self.update_service(s, txt)
+        if stopped:
+            # `stop` was called while we were registering:
+            log("%s stopped during registration", s.service)
+            zc.unregister_service(s.service)
 
     def stop(self) -> None:
-        for s in self.services:
-            log("ZeroconfMulticast.stop(): %s", s.service)
-            if s.registered:
-                s.zeroconf.unregister_service(s.service)
-            s.zeroconf = None
-            s.registered = False
+        registered: list[tuple[Zeroconf, Service]] = []
+        threads: list[Thread] = []
+        with self.lock:
+            for s in self.services:
+                log("ZeroconfMulticast.stop(): %s", s.service)
+                zc = s.zeroconf
+                if zc and s.registered:
+                    registered.append((zc, s))
+                if s.thread:
+                    threads.append(s.thread)
+                s.zeroconf = None
+                s.registered = False
+                s.pending_txt = None
+                s.thread = None
+        # wait for the pending registrations, all sharing the same deadline:
+        # (if this times out, the threads will unregister their service themselves)
+        deadline = monotonic() + REGISTER_JOIN_TIMEOUT
+        for t in threads:
+            t.join(max(0, deadline - monotonic()))
+        for zc, s in registered:
+            zc.unregister_service(s.service)
 
     def update_txt(self, txt) -> None:
         props = txt_rec(txt)
-        for s in self.services:
-            zc = s.zeroconf
-            if not zc:
-                continue
-            s.kwargs["properties"] = props
-            si = ServiceInfo(**s.kwargs)
-            try:
-                zc.update_service(si)
-                s.service = si
-            except TimeoutError:
-                log(f"update_txt({txt})", exc_info=True)
-            except KeyError as e:
-                # probably a race condition with cleanup
-                log("update_txt(%s)", txt, exc_info=True)
-                log.warn("Warning: failed to update service")
-                log.warn(" %s", e)
-            except Exception:
-                log.error("Error: failed to update service", exc_info=True)
+        with self.lock:
+            if props == self.properties:
+                log("update_txt(%s) unchanged", txt)
+                return
+            self.properties = props
+            # once encoded by `ServiceInfo`, the TXT record can be re-used as-is by the other services:
+            properties: dict | bytes = props
+            for s in self.services:
+                if s.registered:
+                    properties = self.update_service(s, properties)
+                else:
+                    # this will be applied once the service is registered:
+                    s.pending_txt = props
+
+    @staticmethod
+    def update_service(s: Service, properties: dict | bytes) -> dict | bytes:
+        zc = s.zeroconf
+        if not zc:
+            return properties
+        s.kwargs["properties"] = properties
+        si = ServiceInfo(**s.kwargs)
+        try:
+            zc.update_service(si)
+            s.service = si
+        except TimeoutError:
+            log(f"update_service({s}, {properties})", exc_info=True)
+        except KeyError as e:
+            # probably a race condition with cleanup
+            log("update_service(%s, %s)", s, properties, exc_info=True)
+            log.warn("Warning: failed to update service")
+            log.warn(" %s", e)
+        except Exception:
+            log.error("Error: failed to update service", exc_info=True)
+        return si.text
 
 
 def main() -> None:
@@ -850,6 +850,22 @@ class SocketProtocol:
         con = self._conn
         if not con:
             return
+        writev = getattr(con, "writev", None)
+        if writev and len(buf_data) > 1 and not self._closed:
+            # try to send all the buffers using a single system call:
+            written = writev(buf_data, packet_type)
+            if written:
+                self.output_raw_packetcount += 1
+            # whatever is left will be sent one buffer at a time:
+            remaining = []
+            for buf in buf_data:
+                size = len(buf)
+                if written >= size:
+                    written -= size
+                    continue
+                remaining.append(buf[written:])
+                written = 0
+            buf_data = remaining
         for buf in buf_data:
             while buf and not self._closed:
                 written = con.write(buf, packet_type)
@@ -6,7 +6,7 @@
 import os
 import sys
 import subprocess
-from queue import SimpleQueue, Empty
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
@@ -47,10 +47,12 @@ WIN32_SHOWWINDOW = envbool("XPRA_WIN32_SHOWWINDOW", False)
 FLUSH = envbool("XPRA_SUBPROCESS_FLUSH", False)
 
 FAULT_RATE = envint("XPRA_WRAPPER_FAULT_INJECTION_RATE")
+# checked before calling INJECT_FAULT, to skip the call entirely when disabled:
+INJECT_FAULTS = FAULT_RATE > 0
 
 
 INJECT_FAULT = noop
-if FAULT_RATE > 0:
+if INJECT_FAULTS:
     _counter = 0
 
     def do_inject_fault(p) -> None:
@@ -63,6 +65,19 @@ if FAULT_RATE > 0:
     INJECT_FAULT = do_inject_fault
 
 
+def get_queued_packet(send_queue: deque) -> tuple[Packet, bool, bool]:
+    # setting the `more` flag keeps the protocol's format thread
+    # pulling packets from the queue until it is empty,
+    # without waiting to be woken up again for each packet.
+    # `append` and `popleft` are atomic, so the deque is safe to share
+    # between the thread calling `send` and the format thread:
+    try:
+        item = send_queue.popleft()
+    except IndexError:
+        return None, False, False
+    return item, False, bool(send_queue)
+
+
 def setup_fastencoder_nocompression(protocol) -> None:
     from xpra.net.packet_encoding import get_enabled_encoders, PERFORMANCE_ORDER
     encoders = get_enabled_encoders(PERFORMANCE_ORDER)
@@ -94,12 +109,15 @@ class SubprocessCallee:
         self._output = None
         self.input_filename = input_filename
         self.output_filename = output_filename
-        self.method_whitelist = method_whitelist
+        self.method_whitelist: frozenset[str] | None = None if method_whitelist is None else frozenset(method_whitelist)
         self.large_packets = []
         # the gobject instance which is wrapped:
         self.wrapped_object = wrapped_object
-        self.send_queue = SimpleQueue()
+        # bound methods of the wrapped object, looked up on first use:
+        self.methods: dict[str, Callable] = {}
+        self.send_queue: deque[Packet] = deque()
         self.protocol = None
+        self.signalled = False
         register_os_signals(self.handle_signal, self.name)
         self.setup_mainloop()
 
@@ -188,7 +206,9 @@ class SubprocessCallee:
         GLib.idle_add(self.stop)
 
     def cleanup(self) -> None:
-        """ subclasses may override this method """
+        """ subclasses may override this method, but must call it """
+        # don't keep the wrapped object alive through its bound methods:
+        self.methods.clear()
 
     def stop(self) -> None:
         p = self.protocol
@@ -205,12 +225,15 @@ class SubprocessCallee:
 
     def handle_signal(self, sig) -> None:
         """ This is for OS signals SIGINT and SIGTERM """
-        # next time, just stop:
-        register_os_signals(self.signal_stop, self.name)
+        if self.signalled:
+            # next time, just stop:
+            self.signal_stop(sig)
+            return
+        self.signalled = True
         signame = SIGNAMES.get(sig, sig)
         log("handle_signal(%s) calling stop from main thread", signame)
         self.send("signal", signame)
-        GLib.timeout_add(0, self.cleanup)
+        GLib.idle_add(self.cleanup)
         # give time for the network layer to send the signal message
         GLib.timeout_add(150, self.stop)
 
@@ -223,21 +246,16 @@ class SubprocessCallee:
     def send(self, packet_type: str, *args: PacketElement) -> None:
         if HEXLIFY_PACKETS:
             args = [packet_type] + [hexstr(str(x)[:32]) for x in args]
-        log("send: adding '%s' message (%s items already in queue)", packet_type, self.send_queue.qsize())
+        log("send: adding '%s' message (%s items already in queue)", packet_type, len(self.send_queue))
         packet = (packet_type, *args)
-        self.send_queue.put(packet)
+        self.send_queue.append(packet)
         if p := self.protocol:
             p.source_has_more()
-        INJECT_FAULT(p)
+        if INJECT_FAULTS:
+            INJECT_FAULT(p)
 
     def get_packet(self) -> tuple[Packet, bool, bool]:
-        try:
-            item = self.send_queue.get(False)
-            more = self.send_queue.qsize() > 0
-        except Empty:
-            item = None
-            more = False
-        return item, False, more
+        return get_queued_packet(self.send_queue)
 
     def process_packet(self, proto, packet: Packet) -> None:
         command = packet.get_str(0)
@@ -262,21 +280,26 @@ class SubprocessCallee:
         # make it easier to hookup signals to methods:
         attr = command.replace("-", "_")
         if self.method_whitelist is not None and attr not in self.method_whitelist:
-            log.warn("invalid command %r, not in whitelist: %s", attr, csv(self.method_whitelist))
+            log.warn("invalid command %r, not in whitelist: %s", attr, csv(sorted(self.method_whitelist)))
             return
         wo = self.wrapped_object
         if not wo:
             log("wrapped object is no more, ignoring method call '%s'", attr)
             return
-        method = getattr(wo, attr, None)
-        if not method:
-            log.warn("unknown command: '%s'", attr)
-            log.warn(" packet: '%s'", repr_ellipsized(str(packet)))
-            return
-        if DEBUG_WRAPPER:
-            log("calling %s.%s%s", wo, attr, str(tuple(packet[1:]))[:128])
-        GLib.idle_add(method, *packet[1:])
-        INJECT_FAULT(proto)
+        method = self.methods.get(attr)
+        if method is None:
+            method = getattr(wo, attr, None)
+            if not method:
+                log.warn("unknown command: '%s'", attr)
+                log.warn(" packet: '%s'", repr_ellipsized(str(packet)))
+                return
+            self.methods[attr] = method
+        args = packet[1:]
+        if DEBUG_WRAPPER and log.is_debug_enabled():
+            log("calling %s.%s%s", wo, attr, str(args)[:128])
+        GLib.idle_add(method, *args)
+        if INJECT_FAULTS:
+            INJECT_FAULT(proto)
 
 
 def exec_kwargs(**kwargs) -> dict[str, Any]:
@@ -320,7 +343,7 @@ class SubprocessCaller(SignalEmitter):
         self.protocol = None
         self.command = None
         self.description = description
-        self.send_queue: SimpleQueue[Packet] = SimpleQueue()
+        self.send_queue: deque[Packet] = deque()
         self.signal_callbacks: dict[str, list[tuple[Callable, list[Any]]]] = {}
         self.large_packets = []
         # hook a default packet handlers:
@@ -403,28 +426,24 @@ class SubprocessCaller(SignalEmitter):
         self.stop()
 
     def get_packet(self) -> tuple[Packet, bool, bool]:
-        try:
-            item = self.send_queue.get(False)
-            more = self.send_queue.qsize() > 0
-        except Empty:
-            item = None
-            more = False
-        return item, False, more
+        return get_queued_packet(self.send_queue)
 
     def send(self, packet_type: str, *packet_data: PacketElement) -> None:
         packet = Packet(packet_type, *packet_data)
-        self.send_queue.put(packet)
+        self.send_queue.append(packet)
         if p := self.protocol:
             p.source_has_more()
             if FLUSH:
                 conn = p._conn
                 if conn and conn.is_active():
                     conn.flush()
-        INJECT_FAULT(p)
+        if INJECT_FAULTS:
+            INJECT_FAULT(p)
 
     def process_packet(self, proto, packet: Packet) -> None:
-        if DEBUG_WRAPPER:
+        if DEBUG_WRAPPER and log.is_debug_enabled():
             log("process_packet(%s, %s)", proto, [str(x)[:32] for x in packet])
         signal_name = packet.get_str(0)
         self._fire_callback(signal_name, packet[1:])
-        INJECT_FAULT(proto)
+        if INJECT_FAULTS:
+            INJECT_FAULT(proto)
@@ -0,0 +1,58 @@
+# This file is part of Xpra.
+# Copyright (C) 2026 Antoine Martin <antoine@xpra.org>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+#cython: boundscheck=False, wraparound=False, initializedcheck=False, always_allow_keywords=False
+
+from libc.stdint cimport uint8_t, uint64_t, uintptr_t   # pylint: disable=syntax-error
+from xpra.buffers.membuf cimport buffer_context
+
+from xpra.net.websockets.mask import hybi_unmask
+
+
+def decode_hybi(buf):
+    """ Decode HyBi style WebSocket packets """
+    cdef Py_ssize_t blen = len(buf)
+    if blen < 2:
+        return None
+    cdef const uint8_t *p
+    cdef uint8_t b1
+    cdef uint8_t b2
+    cdef bint masked
+    cdef Py_ssize_t hlen = 2
+    cdef uint64_t payload_len
+    cdef unsigned int i
+    with buffer_context(buf) as bc:
+        p = <const uint8_t *> (<uintptr_t> int(bc))
+        b1 = p[0]
+        b2 = p[1]
+        masked = (b2 & 0x80) != 0
+        if masked:
+            hlen += 4
+        payload_len = b2 & 0x7f
+        if payload_len == 126:
+            hlen += 2
+            if blen < hlen:
+                return None
+            payload_len = (<uint64_t> p[2] << 8) | p[3]
+        elif payload_len == 127:
+            hlen += 8
+            if blen < hlen:
+                return None
+            payload_len = 0
+            for i in range(8):
+                payload_len = (payload_len << 8) | p[2 + i]
+        elif blen < hlen:
+            return None
+        # an all-zero masking key leaves the payload unchanged (RFC 6455 section 5.3):
+        if masked:
+            masked = (p[hlen - 4] | p[hlen - 3] | p[hlen - 2] | p[hlen - 1]) != 0
+    if <uint64_t> (blen - hlen) < payload_len:
+        return None
+    cdef Py_ssize_t length = hlen + <Py_ssize_t> payload_len
+    if masked:
+        payload = hybi_unmask(buf, hlen - 4, payload_len)
+    else:
+        payload = memoryview(buf)[hlen:length]
+    return b1 & 0x0f, payload, length, (b1 & 0x80) != 0
@@ -11,27 +11,51 @@ from xpra.common import SizedBuffer
 from xpra.net.websockets.common import OPCODE
 from xpra.net.websockets.mask import hybi_unmask
 
+# pre-compiled formats for the 16-bit and 64-bit payload length headers:
+pack_header16 = struct.Struct(">BBH").pack
+pack_header64 = struct.Struct(">BBQ").pack
+unpack_header = struct.Struct(">BB").unpack_from
+unpack_len16 = struct.Struct(">H").unpack_from
+unpack_len64 = struct.Struct(">Q").unpack_from
+
+
+# the first header byte of unmasked close frames never changes:
+CLOSE_FIN = 0x80 | OPCODE.CLOSE
+
 
 def close_packet(code: int = 1000, reason: str = "") -> bytes:
-    data = struct.pack("!H", code)
-    if reason:
-        # should validate that encoded data length is less than 125, meh
-        data += reason.encode("utf-8")
-    header = encode_hybi_header(OPCODE.CLOSE, len(data), has_mask=False, fin=True)
-    return header + data
+    # control frames are limited to 125 bytes of payload,
+    # and the reason must remain valid utf-8 after truncation:
+    rbytes = reason.encode("utf-8")[:123].decode("utf-8", "ignore").encode("utf-8") if reason else b""
+    return bytes((CLOSE_FIN, 2 + len(rbytes), code >> 8, code & 0xff)) + rbytes
 
 
 def encode_hybi_header(opcode, payload_len, has_mask=False, fin=True) -> bytes:
     """ Encode a HyBi style WebSocket frame """
     if (opcode & 0x0f) != opcode:
         raise ValueError(f"invalid opcode {opcode:x}")
-    mask_bit = 0x80 * has_mask
-    b1 = opcode | (0x80 * fin)
-    if payload_len <= 125:
-        return struct.pack('>BB', b1, payload_len | mask_bit)
+    mask_bit = 0x80 if has_mask else 0
+    b1 = opcode | 0x80 if fin else opcode
+    if payload_len < 126:
+        return bytes((b1, payload_len | mask_bit))
     if payload_len < 65536:
-        return struct.pack('>BBH', b1, 126 | mask_bit, payload_len)
-    return struct.pack('>BBQ', b1, 127 | mask_bit, payload_len)
+        return pack_header16(b1, 126 | mask_bit, payload_len)
+    return pack_header64(b1, 127 | mask_bit, payload_len)
+
+
+# the first header byte of unmasked binary frames never changes:
+BINARY_FIN = 0x80 | OPCODE.BINARY
+# all the two byte headers for short unmasked binary frames:
+SHORT_BINARY_HEADERS = tuple(bytes((BINARY_FIN, payload_len)) for payload_len in range(126))
+
+
+def encode_binary_header(payload_len: int) -> bytes:
+    """ Same as `encode_hybi_header(OPCODE.BINARY, payload_len)`, for the most common frame type """
+    if payload_len < 126:
+        return SHORT_BINARY_HEADERS[payload_len]
+    if payload_len < 65536:
+        return pack_header16(BINARY_FIN, 126, payload_len)
+    return pack_header64(BINARY_FIN, 127, payload_len)
 
 
 def decode_hybi(buf: SizedBuffer) -> tuple[int, SizedBuffer, int, int] | None:
@@ -42,7 +66,9 @@ def decode_hybi(buf: SizedBuffer) -> tuple[int, SizedBuffer, int, int] | None:
         # log("decode_hybi_header() buffer too small: %i", blen)
         return None
 
-    b1, b2 = struct.unpack(">BB", buf[:2])
+    # avoid copying the buffer when slicing it:
+    mv = buf if isinstance(buf, memoryview) else memoryview(buf)
+    b1, b2 = unpack_header(mv)
     opcode = b1 & 0x0f
     fin = bool(b1 & 0x80)
     masked = bool(b2 & 0x80)
@@ -58,13 +84,13 @@ def decode_hybi(buf: SizedBuffer) -> tuple[int, SizedBuffer, int, int] | None:
         if blen < hlen:
             # log("decode_hybi_header() buffer too small for 126 payload: %i", blen)
             return None
-        payload_len = struct.unpack('>H', buf[2:4])[0]
+        payload_len = unpack_len16(mv, 2)[0]
     elif payload_len == 127:
         hlen += 8
         if blen < hlen:
             # log("decode_hybi_header() buffer too small for 127 payload: %i", blen)
             return None
-        payload_len = struct.unpack('>Q', buf[2:10])[0]
+        payload_len = unpack_len64(mv, 2)[0]
 
     # log("decode_hybi_header() decoded header '%s': hlen=%i,
     #    payload_len=%i, buffer len=%i", binascii.hexlify(buf[:hlen]), hlen, payload_len, blen)
@@ -73,10 +99,19 @@ def decode_hybi(buf: SizedBuffer) -> tuple[int, SizedBuffer, int, int] | None:
         # log("decode_hybi_header() buffer too small for payload: %i (needed %i)", blen, length)
         return None
 
-    if masked:
-        payload = hybi_unmask(buf, hlen - 4, payload_len)
+    # an all-zero masking key leaves the payload unchanged (RFC 6455 section 5.3),
+    # so we can skip unmasking it:
+    if masked and any(mv[hlen - 4:hlen]):
+        payload = hybi_unmask(mv, hlen - 4, payload_len)
     else:
-        payload = buf[hlen:length]
+        payload = mv[hlen:length]
     # log("decode_hybi_header() payload_len=%i, hlen=%i,
     #    length=%i, fin=%s", payload_len, hlen, length, fin)
     return opcode, payload, length, fin
+
+
+try:
+    # use the Cython version when available:
+    from xpra.net.websockets.cyheader import decode_hybi  # noqa: F401
+except ImportError:
+    pass
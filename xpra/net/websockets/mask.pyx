@@ -5,7 +5,7 @@
 
 #cython: boundscheck=False, wraparound=False, initializedcheck=False, always_allow_keywords=False
 
-from libc.stdint cimport uint32_t, uintptr_t   # pylint: disable=syntax-error
+from libc.stdint cimport uint64_t, uintptr_t   # pylint: disable=syntax-error
 from xpra.buffers.membuf cimport getbuf, MemBuf, buffer_context
 
 from xpra.common import SizedBuffer
@@ -37,8 +37,10 @@ cdef memoryview do_hybi_mask(uintptr_t mp, uintptr_t dp, unsigned long long data
     if datalen > MAX_WEBSOCKET_PAYLOAD:
         raise ValueError(f"data too large: {datalen} bytes")
     # alignment of the data pointer:
-    cdef unsigned int align = (<uintptr_t> dp) & 0x3
-    cdef unsigned int initial_chars = 4 - align
+    cdef unsigned int align = (<uintptr_t> dp) & 0x7
+    cdef unsigned long long initial_chars = (8 - align) & 0x7
+    if initial_chars > datalen:
+        initial_chars = datalen
     cdef MemBuf out_buf = getbuf(datalen + align, 0)
     cdef uintptr_t op = <uintptr_t> out_buf.get_mem()
     # char pointers:
@@ -46,33 +48,32 @@ cdef memoryview do_hybi_mask(uintptr_t mp, uintptr_t dp, unsigned long long data
     cdef unsigned char *dcbuf = <unsigned char *> dp
     cdef unsigned char *ocbuf = <unsigned char *> op
     cdef unsigned int i
-    # bytes at a time until we reach the 32-bit boundary:
+    # bytes at a time until we reach the 64-bit boundary:
     for i in range(initial_chars):
         ocbuf[align + i] = dcbuf[i] ^ mcbuf[i & 0x3]
-    # 32-bit pointers:
-    cdef uint32_t *dbuf
-    cdef uint32_t *obuf
-    cdef uint32_t mask_value
-    cdef unsigned long long uint32_steps
+    # 64-bit pointers:
+    cdef uint64_t *dbuf
+    cdef uint64_t *obuf
+    cdef uint64_t mask_value
+    cdef unsigned long long uint64_steps = (datalen - initial_chars) // 8
     cdef unsigned long long j
     cdef unsigned int last_chars
-    if datalen > initial_chars:
-        uint32_steps = (datalen - initial_chars) // 4
-        if uint32_steps:
-            with nogil:
-                dbuf = <uint32_t*> (dp + initial_chars)
-                obuf = <uint32_t*> (op + align + initial_chars)
-                mask_value = 0
-                for i in range(4):
-                    mask_value = mask_value << 8
-                    mask_value += mcbuf[(3 - i + initial_chars) & 0x3]
-                for i in range(uint32_steps):
-                    obuf[i] = dbuf[i] ^ mask_value
-        # bytes at a time again at the end:
-        last_chars = (datalen - initial_chars) & 0x3
-        for i in range(last_chars):
-            j = datalen - last_chars + i
-            ocbuf[align + j] = dcbuf[j] ^ mcbuf[j & 0x3]
+    if uint64_steps:
+        with nogil:
+            dbuf = <uint64_t*> (dp + initial_chars)
+            obuf = <uint64_t*> (op + align + initial_chars)
+            # the 4-byte mask repeated twice, rotated to match the data offset:
+            mask_value = 0
+            for i in range(8):
+                mask_value = mask_value << 8
+                mask_value += mcbuf[(7 - i + initial_chars) & 0x3]
+            for j in range(uint64_steps):
+                obuf[j] = dbuf[j] ^ mask_value
+    # bytes at a time again at the end:
+    last_chars = (datalen - initial_chars) & 0x7
+    for i in range(last_chars):
+        j = datalen - last_chars + i
+        ocbuf[align + j] = dcbuf[j] ^ mcbuf[j & 0x3]
     if align > 0:
         return (memoryview(out_buf)[align:]).toreadonly()
     return memoryview(out_buf).toreadonly()
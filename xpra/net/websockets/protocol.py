@@ -9,7 +9,7 @@ from collections.abc import Callable
 
 from xpra.common import SizedBuffer
 from xpra.net.websockets.mask import hybi_mask
-from xpra.net.websockets.header import encode_hybi_header, decode_hybi, close_packet
+from xpra.net.websockets.header import encode_hybi_header, encode_binary_header, decode_hybi, close_packet
 from xpra.net.websockets.common import OPCODE, OPCODE_STR
 from xpra.net.protocol.socket_handler import SocketProtocol
 from xpra.util.env import envbool, first_time
@@ -32,6 +32,8 @@ class WebSocketProtocol(SocketProtocol):
         self.ws_xpra_data: list[SizedBuffer] = []
         self.ws_payload_opcode: int = 0
         self.ws_mask: bool = MASK
+        # re-used by `recv_into` for reading from the connection:
+        self.ws_read_buffer = bytearray()
         self.make_chunk_header: Callable = self.make_xpra_header
         self.make_frame_header: Callable = self.make_wsframe_header
 
@@ -50,7 +52,10 @@ class WebSocketProtocol(SocketProtocol):
 
     def recv_into(self, buf) -> int:
         while not self.ws_xpra_data and not self._closed:
-            raw_buf = bytearray(self.read_buffer_size)
+            # `parse_ws_frame` copies the data it keeps, so we can re-use the same buffer:
+            raw_buf = self.ws_read_buffer
+            if len(raw_buf) != self.read_buffer_size:
+                raw_buf = self.ws_read_buffer = bytearray(self.read_buffer_size)
             n = SocketProtocol.recv_into(self, raw_buf)
             if not n:
                 return 0
@@ -71,7 +76,10 @@ class WebSocketProtocol(SocketProtocol):
 
     def make_wsframe_header(self, packet_type: str, items: list[SizedBuffer]) -> bytes:
         payload_len = sum(len(item) for item in items)
-        header = encode_hybi_header(OPCODE.BINARY, payload_len, self.ws_mask)
+        if self.ws_mask:
+            header = encode_hybi_header(OPCODE.BINARY, payload_len, True)
+        else:
+            header = encode_binary_header(payload_len)
         log("make_wsframe_header(%s, %i items) %i bytes, ws_mask=%s, header=0x%s (%i bytes)",
             packet_type, len(items), payload_len, self.ws_mask, hexstr(header), len(header))
         if self.ws_mask:
@@ -10,6 +10,7 @@ from typing import TypeAlias
 
 from xpra.notification.common import IconData
 from xpra.util.env import osexpand, envint
+from xpra.platform.paths import get_xpra_tmp_dir
 from xpra.log import Logger
 from xpra.common import noop
 from xpra.constants import NotificationID
@@ -18,6 +19,8 @@ log = Logger("notify")
 
 AUTO_DELETE_DELAY = envint("XPRA_AUTO_DELETE_DELAY", 60)
 
+ICON_FORMATS = frozenset(("png", "webp", "jpeg"))
+
 NID: TypeAlias = int | NotificationID
 
 
@@ -27,15 +30,17 @@ class NotifierBase:
         # posix only - but degrades ok on non-posix:
         self.dbus_id = os.environ.get("DBUS_SESSION_BUS_ADDRESS", "")
         self.temp_files = {}
+        # the expanded temporary directory, once we have verified that it exists:
+        self.tmp_dir = ""
         self.closed_cb = closed_cb
         self.action_cb = action_cb
         self.handles_actions = False
 
     def cleanup(self) -> None:
-        if tf := self.temp_files.keys():
-            self.temp_files = {}
-            for nid in tf:
-                self.clean_notification(nid)
+        tf = self.temp_files
+        self.temp_files = {}
+        for temp_file in tf.values():
+            self.remove_temp_file(temp_file)
 
     def show_notify(self, dbus_id: str, tray, nid: NID,
                     app_name: str, replaces_nid: NID, app_icon: str,
@@ -56,39 +61,52 @@ class NotifierBase:
 
     def temp_icon_file(self, nid: int, icon: IconData) -> str:
         ext = icon[0]
-        if ext not in ("png", "webp", "jpeg"):
+        if ext not in ICON_FORMATS:
             log.warn("Warning: unsuppported icon data type %r", ext)
             return ""
         icon_data = icon[3]
-        from xpra.platform.paths import get_xpra_tmp_dir
-        tmp = osexpand(get_xpra_tmp_dir())
-        d = tmp
-        missing = []
-        while d and not os.path.exists(d):
-            missing.append(d)
-            d = os.path.dirname(d)
-        for d in reversed(missing):
-            os.mkdir(d, 0o700)
-        temp = tempfile.NamedTemporaryFile(mode='w+b', suffix='.%s' % ext,
-                                           prefix='xpra-notification-icon-', dir=tmp, delete=False)
-        temp.write(icon_data)
-        temp.close()
-        self.temp_files[nid] = temp.name
+        tmp = self.get_tmp_dir()
+        fd, filename = tempfile.mkstemp(suffix=f".{ext}", prefix="xpra-notification-icon-", dir=tmp)
+        try:
+            view = memoryview(icon_data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        self.temp_files[nid] = filename
         if AUTO_DELETE_DELAY > 0:
             from xpra.os_util import gi_import
             GLib = gi_import("GLib")
             GLib.timeout_add(AUTO_DELETE_DELAY, self.clean_notification, nid)
-        return temp.name
+        return filename
+
+    def get_tmp_dir(self) -> str:
+        tmp = self.tmp_dir
+        if not tmp:
+            tmp = osexpand(get_xpra_tmp_dir())
+            d = tmp
+            missing = []
+            while d and not os.path.exists(d):
+                missing.append(d)
+                d = os.path.dirname(d)
+            for d in reversed(missing):
+                os.mkdir(d, 0o700)
+            self.tmp_dir = tmp
+        return tmp
 
     def clean_notification(self, nid: NID) -> None:
         temp_file = self.temp_files.pop(int(nid), "")
         log("clean_notification(%s) temp_file=%s", nid, temp_file)
         if temp_file:
-            try:
-                os.unlink(temp_file)
-            except Exception as e:
-                log("failed to remove temporary icon file '%s':", temp_file)
-                log(" %s", e)
+            self.remove_temp_file(temp_file)
+
+    @staticmethod
+    def remove_temp_file(temp_file: str) -> None:
+        try:
+            os.unlink(temp_file)
+        except Exception as e:
+            log("failed to remove temporary icon file '%s':", temp_file)
+            log(" %s", e)
 
     def dbus_check(self, dbus_id: str) -> bool:
         if dbus_id and self.dbus_id == dbus_id:
@@ -5,12 +5,14 @@
 # later version. See the file COPYING for details.
 
 from typing import Any
+from threading import Lock, RLock
+from collections.abc import Callable
 
 from ctypes import (
     WinDLL, WINFUNCTYPE, GetLastError,  # @UnresolvedImport
     POINTER, Structure, Union,
-    c_ulong, c_ushort, c_ubyte, c_int, c_long, c_void_p, c_size_t, c_ssize_t, c_char,
-    byref, sizeof,
+    c_ulong, c_ushort, c_ubyte, c_int, c_void_p, c_size_t, c_ssize_t, c_char,
+    byref, sizeof, create_unicode_buffer,
 )
 from ctypes.wintypes import (
     HWND, DWORD, WPARAM, LPARAM, HDC, HMONITOR, HMODULE,
@@ -25,7 +27,8 @@ from ctypes.wintypes import (
 assert GetLastError
 
 LPCTSTR = LPCSTR
-LRESULT = c_long
+# LONG_PTR:
+LRESULT = c_ssize_t
 DEVMODE = c_void_p
 PDWORD = POINTER(DWORD)
 LPDWORD = POINTER(DWORD)
@@ -440,8 +443,14 @@ SendMessageW = user32.SendMessageW
 SendMessageW.argtypes = [HWND, UINT, WPARAM, LPARAM]
 SendMessageW.restype = LRESULT
 PostMessageA = user32.PostMessageA
+PostMessageA.argtypes = [HWND, UINT, WPARAM, LPARAM]
+PostMessageA.restype = BOOL
 FindWindowA = user32.FindWindowA
+FindWindowA.argtypes = [LPCSTR, LPCSTR]
+FindWindowA.restype = HWND
 GetWindowRect = user32.GetWindowRect
+GetWindowRect.argtypes = [HWND, POINTER(RECT)]
+GetWindowRect.restype = BOOL
 GetDoubleClickTime = user32.GetDoubleClickTime
 _EnumDisplayMonitors = user32.EnumDisplayMonitors
 MonitorFromWindow = user32.MonitorFromWindow
@@ -472,6 +481,8 @@ DispatchMessageW = user32.DispatchMessageW
 DispatchMessageW.argtypes = [LPMSG]
 DispatchMessageW.restype = LRESULT
 MapVirtualKeyW = user32.MapVirtualKeyW
+MapVirtualKeyW.argtypes = [UINT, UINT]
+MapVirtualKeyW.restype = UINT
 GetKeyboardState = user32.GetKeyboardState
 GetKeyboardState.argtypes = [PBYTE]
 GetKeyboardState.restype = BOOL
@@ -542,7 +553,7 @@ GetKeyboardLayout = user32.GetKeyboardLayout
 GetKeyboardLayout.argtypes = [DWORD]
 GetKeyboardLayout.restype = HKL
 GetKeyboardLayoutList = user32.GetKeyboardLayoutList
-GetKeyboardLayoutList.restype = int
+GetKeyboardLayoutList.restype = INT
 # noinspection PyTypeChecker
 GetKeyboardLayoutList.argtypes = [c_int, POINTER(HANDLE * 32)]
 GetKeyboardLayoutName = user32.GetKeyboardLayoutNameA
@@ -570,6 +581,8 @@ ReleaseDC = user32.ReleaseDC
 ReleaseDC.restype = c_int
 ReleaseDC.argtypes = [HWND, HDC]
 mouse_event = user32.mouse_event
+mouse_event.argtypes = [DWORD, DWORD, DWORD, DWORD, c_size_t]
+mouse_event.restype = None
 ToUnicode = user32.ToUnicode
 ToUnicode.argtypes = [UINT, UINT, PBYTE, LPWSTR, c_int, UINT]
 ToUnicode.restype = c_int
@@ -712,7 +725,8 @@ AppendMenuW.argtypes = [HMENU, UINT, UINT, LPCWSTR]
 
 class COPYDATASTRUCT(Structure):
     _fields_ = [
-        ("dwData", POINTER(ULONG)),
+        # ULONG_PTR:
+        ("dwData", c_size_t),
         ("cbData", DWORD),
         ("lpData", LPVOID),
     ]
@@ -860,6 +874,8 @@ GetSystemPaletteEntries.restype = UINT
 GetStockObject = gdi32.GetStockObject
 GetStockObject.restype = HGDIOBJ
 SetPixelV = gdi32.SetPixelV
+SetPixelV.argtypes = [HDC, c_int, c_int, DWORD]
+SetPixelV.restype = BOOL
 CreateDIBSection = gdi32.CreateDIBSection
 CreateDIBSection.restype = HBITMAP
 CreateDIBSection.argtypes = [HANDLE, POINTER(BITMAPV5HEADER), UINT, POINTER(c_void_p), HANDLE, DWORD]
@@ -909,16 +925,63 @@ _EnumDisplayMonitors.argtypes = [HDC, POINTER(RECT), MonitorEnumProc, LPARAM]
 _EnumDisplayMonitors.restype = BOOL
 
 
+# use a single callback instance rather than creating a new one for every call,
+# the lock protects the list it populates:
+enum_monitors_lock = Lock()
+enum_monitors_results: list = []
+
+
+def _enum_monitors_callback(monitor, _dc, _rect, _data) -> int:
+    enum_monitors_results.append(monitor)
+    return 1
+
+
+enum_monitors_callback = MonitorEnumProc(_enum_monitors_callback)
+
+
 def EnumDisplayMonitors() -> list:
-    results = []
+    with enum_monitors_lock:
+        try:
+            _EnumDisplayMonitors(0, None, enum_monitors_callback, 0)
+            return list(enum_monitors_results)
+        finally:
+            enum_monitors_results.clear()
+
+
+# format name -> format id,
+# registered clipboard formats remain valid for the lifetime of the session:
+clipboard_formats: dict[bytes, int] = {}
+
+
+def register_clipboard_format(name: bytes) -> int:
+    fmt = clipboard_formats.get(name, 0)
+    if not fmt:
+        fmt = RegisterClipboardFormatA(name)
+        if fmt:
+            clipboard_formats[name] = fmt
+    return fmt
 
-    def _callback(monitor, _dc, _rect, _data):
-        results.append(monitor)
-        return 1
 
-    callback = MonitorEnumProc(_callback)
-    _EnumDisplayMonitors(0, None, callback, 0)
-    return results
+# same for EnumWindows, the native callback forwards to the function given to `enum_windows`,
+# the lock is re-entrant so that this function can be called from within a callback:
+enum_windows_lock = RLock()
+enum_windows_targets: list[Callable[[int, int], bool]] = []
+
+
+def _enum_windows_callback(hwnd, lparam) -> bool:
+    return enum_windows_targets[-1](hwnd, lparam)
+
+
+enum_windows_callback = EnumWindowsProc(_enum_windows_callback)
+
+
+def enum_windows(callback: Callable[[int, int], bool]) -> None:
+    with enum_windows_lock:
+        enum_windows_targets.append(callback)
+        try:
+            EnumWindows(enum_windows_callback, 0)
+        finally:
+            enum_windows_targets.pop()
 
 
 def GetIntSystemParametersInfo(key) -> int | None:
@@ -959,13 +1022,8 @@ class GUID(Structure):
     ]
 
     def __str__(self):
-        return "{%08x-%04x-%04x-%s-%s}" % (
-            self.Data1,
-            self.Data2,
-            self.Data3,
-            ''.join(["%02x" % d for d in self.Data4[:2]]),
-            ''.join(["%02x" % d for d in self.Data4[2:]]),
-        )
+        d4 = bytes(self.Data4).hex()
+        return f"{{{self.Data1:08x}-{self.Data2:04x}-{self.Data3:04x}-{d4[:4]}-{d4[4:]}}}"
 
 
 IID = GUID
@@ -1023,22 +1081,31 @@ LCID_DEFAULT = MAKELANGID(LANG_NEUTRAL, SUBLANG_DEFAULT)
 LCID_NEUTRAL = MAKELANGID(LANG_NEUTRAL, SUBLANG_NEUTRAL)
 
 
+# system messages are never longer than this:
+FORMAT_MESSAGE_SIZE = 512
+
+# (message_id, langid) -> message:
+format_message_cache: dict[tuple[int, int], str] = {}
+
+
 def FormatMessageSystem(message_id, langid: int = LCID_ENGLISH) -> str:
-    from xpra.platform.win32.constants import (
-        FORMAT_MESSAGE_ALLOCATE_BUFFER, FORMAT_MESSAGE_FROM_SYSTEM, FORMAT_MESSAGE_IGNORE_INSERTS,
-    )
-    sys_flag = FORMAT_MESSAGE_ALLOCATE_BUFFER | FORMAT_MESSAGE_FROM_SYSTEM | FORMAT_MESSAGE_IGNORE_INSERTS
-    bufptr = LPWSTR()
-    chars = kernel32.FormatMessageW(sys_flag, None, message_id, langid, byref(bufptr), 0, None)
+    key = (message_id, langid)
+    message = format_message_cache.get(key)
+    if message is None:
+        message = format_message_cache[key] = do_format_message_system(message_id, langid)
+    return message
+
+
+def do_format_message_system(message_id, langid: int) -> str:
+    from xpra.platform.win32.constants import FORMAT_MESSAGE_FROM_SYSTEM, FORMAT_MESSAGE_IGNORE_INSERTS
+    sys_flag = FORMAT_MESSAGE_FROM_SYSTEM | FORMAT_MESSAGE_IGNORE_INSERTS
+    buf = create_unicode_buffer(FORMAT_MESSAGE_SIZE)
+    chars = FormatMessageW(sys_flag, None, message_id, langid, buf, FORMAT_MESSAGE_SIZE, None)
     if not chars:
-        chars = FormatMessageW(sys_flag, None, message_id, LCID_NEUTRAL, byref(bufptr), 0, None)
+        chars = FormatMessageW(sys_flag, None, message_id, LCID_NEUTRAL, buf, FORMAT_MESSAGE_SIZE, None)
         if not chars:
             return str(message_id)
-    if not bufptr.value:
-        return str(message_id)
-    val = bufptr.value[:chars]
-    LocalFree(bufptr)
-    return str(val)
+    return buf.value[:chars] or str(message_id)
 
 
 PFD_TYPE_RGBA = 0
@@ -10,7 +10,7 @@ from io import BytesIO
 from collections.abc import Sequence, Callable
 from ctypes import (
     get_last_error, WinError, FormatError,  # @UnresolvedImport
-    sizeof, byref, cast, memset, memmove, create_string_buffer, c_char, c_void_p,
+    sizeof, byref, cast, memset, memmove, string_at, create_string_buffer, c_char, c_void_p,
 )
 from ctypes.wintypes import HBITMAP
 
@@ -28,7 +28,7 @@ from xpra.platform.win32.common import (
     WideCharToMultiByte, MultiByteToWideChar,
     AddClipboardFormatListener, RemoveClipboardFormatListener,
     SetClipboardData, EnumClipboardFormats, GetClipboardFormatNameA, GetClipboardOwner,
-    RegisterClipboardFormatA,
+    register_clipboard_format,
     GetWindowThreadProcessId, QueryFullProcessImageNameA, OpenProcess, CloseHandle,
     CreateDIBitmap,
 )
@@ -242,13 +242,14 @@ def w_to_utf8(data):
     length = WideCharToMultiByte(CP_UTF8, 0, wstr, -1, byref(buf), ulen, None, None)
     if length == 0:
         raise ValueError("failed to convert to UTF8: %s" % FormatError(get_last_error()))
-    if buf.raw[length - 1:length] == b"\0":
-        b = buf.raw[:length - 1]
-    else:
-        b = buf.raw[:length]
+    if buf[length - 1] == b"\0":
+        length -= 1
+    b = string_at(buf, length)
     log("got %i UTF8 bytes: %s", len(b), Ellipsizer(b))
     if CONVERT_LINE_ENDINGS:
-        return b.decode("utf8").replace("\r\n", "\n").encode("utf8")
+        # CR and LF never appear inside multi-byte UTF8 sequences,
+        # so there is no need to decode the data:
+        return b.replace(b"\r\n", b"\n")
     return b
 
 
@@ -513,8 +514,7 @@ class Win32ClipboardProxy(ClipboardProxyCore):
     def get_clipboard_image(self, img_format, got_image, errback):
         def got_clipboard_lock() -> bool:
             if COMPRESSED_IMAGES:
-                fmt_name = LPCSTR(img_format.upper().encode("latin1") + b"\0")  # ie: "PNG"
-                fmt = RegisterClipboardFormatA(fmt_name)
+                fmt = register_clipboard_format(img_format.upper().encode("latin1"))  # ie: "PNG"
                 if fmt:
                     data_handle = GetClipboardData(fmt)
                     if data_handle:
@@ -609,7 +609,7 @@ class Win32ClipboardProxy(ClipboardProxyCore):
 
     def get_clipboard_html(self, callback: Callable[[bytes], None], errback: Callable[[str], None]):
         def get_html() -> bool:
-            fmt = RegisterClipboardFormatA(LPCSTR(CF_HTML_NAME + b"\0"))
+            fmt = register_clipboard_format(CF_HTML_NAME)
             if not fmt or fmt not in get_clipboard_formats():
                 errback("no HTML clipboard format available")
                 return True
@@ -699,8 +699,7 @@ class Win32ClipboardProxy(ClipboardProxyCore):
         image_formats = {}
         if COMPRESSED_IMAGES:
             # first save it as binary compressed data:
-            fmt_name = LPCSTR(img_format.upper().encode("latin1") + b"\0")  # ie: "PNG"
-            fmt = RegisterClipboardFormatA(fmt_name)
+            fmt = register_clipboard_format(img_format.upper().encode("latin1"))  # ie: "PNG"
             if fmt:
                 l = len(img_data)
                 # noinspection PyTypeChecker
@@ -750,7 +749,7 @@ class Win32ClipboardProxy(ClipboardProxyCore):
         if isinstance(html_data, str):
             html_data = html_data.encode("utf8")
         cf_html = wrap_CF_HTML(html_data)
-        fmt = RegisterClipboardFormatA(LPCSTR(CF_HTML_NAME + b"\0"))
+        fmt = register_clipboard_format(CF_HTML_NAME)
         if not fmt:
             set_err("failed to register the 'HTML Format' clipboard format")
             return
@@ -741,22 +741,18 @@ def get_workarea() -> tuple[int, int, int, int] | None:
         # first we need to find the absolute top-left and bottom-right corners
         # so we can make everything relative to 0,0
         monitors = []
+        workareas = []
         for m in EnumDisplayMonitors():
             mi = GetMonitorInfo(m)
-            mx1, my1, mx2, my2 = mi['Monitor']
-            monitors.append((mx1, my1, mx2, my2))
+            monitors.append(mi['Monitor'])
+            # absolute workarea / monitor coordinates:
+            workareas.append(mi['Work'])
         minmx = min(x[0] for x in monitors)
         minmy = min(x[1] for x in monitors)
         maxmx = max(x[2] for x in monitors)
         maxmy = max(x[3] for x in monitors)
         screenlog("get_workarea() absolute total monitor area: %s", (minmx, minmy, maxmx, maxmy))
         screenlog(" total monitor dimensions: %s", (maxmx - minmx, maxmy - minmy))
-        workareas = []
-        for m in EnumDisplayMonitors():
-            mi = GetMonitorInfo(m)
-            # absolute workarea / monitor coordinates:
-            wx1, wy1, wx2, wy2 = mi['Work']
-            workareas.append((wx1, wy1, wx2, wy2))
         assert len(workareas) > 0
         minwx = min(w[0] for w in workareas)
         minwy = min(w[1] for w in workareas)
@@ -943,7 +939,7 @@ def show_desktop(b) -> None:
     else:
         v = MIN_ALL_UNDO
     try:
-        root = FindWindowA("Shell_TrayWnd", None)
+        root = FindWindowA(b"Shell_TrayWnd", None)
         assert root is not None, "cannot find 'Shell_TrayWnd'"
         SendMessageA(root, win32con.WM_COMMAND, v, 0)
     except Exception as e:
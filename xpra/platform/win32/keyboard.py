@@ -40,18 +40,17 @@ LAYOUT_MASKS: dict[int, Sequence[int]] = {
 MAPVK_VK_TO_VSC: Final[int] = 0
 
 
+# must match the `GetKeyboardLayoutList.argtypes` declaration:
+MAX_LAYOUTS = 32
+# re-used for every call to `GetKeyboardLayoutList`:
+# noinspection PyTypeChecker,PyCallingNonCallable
+layout_handles = (HANDLE * MAX_LAYOUTS)()
+layout_handles_ref = ctypes.byref(layout_handles)
+
+
 def _GetKeyboardLayoutList() -> list[int]:
-    max_items = 32
-    # PHANDLE = ctypes.POINTER(HANDLE)
-    # noinspection PyTypeChecker,PyCallingNonCallable
-    handle_list = (HANDLE * max_items)()
-    # noinspection PyTypeChecker
-    GetKeyboardLayoutList.argtypes = [ctypes.c_int, ctypes.POINTER(HANDLE * max_items)]
-    count = GetKeyboardLayoutList(max_items, ctypes.byref(handle_list))
-    layouts: list[int] = []
-    for i in range(count):
-        layouts.append(int(handle_list[i]))
-    return layouts
+    count = GetKeyboardLayoutList(MAX_LAYOUTS, layout_handles_ref)
+    return [int(hkl) for hkl in layout_handles[:count]]
 
 
 def get_layout_defs() -> dict[str, int]:
@@ -105,14 +104,8 @@ def get_window_layout() -> int:
 
 def x11_layouts_to_win32_hkl() -> dict[str, int]:
     layout_to_hkl: dict[str, int] = {}
-    max_items = 32
     try:
-        # noinspection PyTypeChecker,PyCallingNonCallable
-        handle_list = (HANDLE * max_items)()
-        count = GetKeyboardLayoutList(max_items, ctypes.byref(handle_list))
-        for i in range(count):
-            hkl = handle_list[i]
-            hkli = int(hkl)
+        for hkli in _GetKeyboardLayoutList():
             for mask, bitshifts in LAYOUT_MASKS.items():
                 kbid = 0
                 for bitshift in bitshifts:
@@ -4,6 +4,7 @@
 # Xpra is released under the terms of the GNU GPL v2, or, at your option, any
 # later version. See the file COPYING for details.
 
+from threading import local
 from ctypes import byref
 from ctypes.wintypes import POINT
 
@@ -38,9 +39,17 @@ def move_pointer(x: int, y: int) -> None:
     SetPhysicalCursorPos(x, y)
 
 
+# each thread re-uses the same `POINT` structure for `get_position`:
+thread_point = local()
+
+
 def get_position() -> tuple[int, int]:
-    pos = POINT()
-    GetPhysicalCursorPos(byref(pos))  # NOSONAR
+    scratch = getattr(thread_point, "scratch", None)
+    if scratch is None:
+        pos = POINT()
+        scratch = thread_point.scratch = pos, byref(pos)
+    pos, pos_ref = scratch
+    GetPhysicalCursorPos(pos_ref)  # NOSONAR
     return pos.x, pos.y
 
 
@@ -11,7 +11,7 @@ from typing import Any
 
 from xpra.platform.win32.common import (
     FindWindowA, IsWindowVisible, GetWindowThreadProcessId, GetWindowTextLengthW,
-    GetWindowTextW, GetWindowRect, EnumWindows, EnumWindowsProc, EnumDisplayMonitors, GetMonitorInfo,
+    GetWindowTextW, GetWindowRect, enum_windows, EnumDisplayMonitors, GetMonitorInfo,
 )
 from xpra.util.env import envbool
 from xpra.log import Logger
@@ -24,7 +24,7 @@ def get_shape_rectangles(logit=False) -> list:
     log_fn = shapelog.debug
     if logit or envbool("XPRA_SHAPE_DEBUG", False):
         log_fn = shapelog.info
-    taskbar = FindWindowA("Shell_TrayWnd", None)
+    taskbar = FindWindowA(b"Shell_TrayWnd", None)
     log_fn("taskbar window=%#x", taskbar)
     ourpid = os.getpid()
     log_fn("our pid=%i", ourpid)
@@ -99,7 +99,7 @@ def get_shape_rectangles(logit=False) -> list:
         rectangles.append((left, top, w, h))
         return True
 
-    EnumWindows(EnumWindowsProc(enum_windows_cb), 0)
+    enum_windows(enum_windows_cb)
     log_fn("get_shape_rectangles()=%s", rectangles)
     return sorted(rectangles)
 
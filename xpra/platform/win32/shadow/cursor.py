@@ -4,7 +4,6 @@
 # later version. See the file COPYING for details.
 
 from ctypes import sizeof, byref, c_char
-from ctypes.wintypes import MAX_PATH
 
 from xpra.util.str_fn import strtobytes
 from xpra.platform.win32 import constants as win32con
@@ -31,6 +30,7 @@ def get_cursor_data(hCursor) -> list | None:
     memdc = None
     bitmap = None
     old_handle = None
+    ii = iie = None
     try:
         ii = ICONINFO()
         ii.cbSize = sizeof(ICONINFO)
@@ -47,8 +47,9 @@ def get_cursor_data(hCursor) -> list | None:
         iie.cbSize = sizeof(ICONINFOEXW)
         if not GetIconInfoExW(hCursor, byref(iie)):
             raise OSError()  # @UndefinedVariable
-        name = iie.szResName[:MAX_PATH]
-        log("wResID=%#x, sxModName=%s, szResName=%s", iie.wResID, iie.sxModName[:MAX_PATH], name)
+        # the string fields are already NUL terminated:
+        name = iie.szResName
+        log("wResID=%#x, sxModName=%s, szResName=%s", iie.wResID, iie.sxModName, name)
         bm = Bitmap()
         if not GetObjectA(ii.hbmColor, sizeof(Bitmap), byref(bm)):
             raise OSError()  # @UndefinedVariable
@@ -115,3 +116,9 @@ def get_cursor_data(hCursor) -> list | None:
             DeleteDC(memdc)
         if dc:
             ReleaseDC(None, dc)
+        # `GetIconInfo` and `GetIconInfoExW` create copies of the bitmaps, which we own:
+        for info in (ii, iie):
+            if info:
+                for hbm in (info.hbmMask, info.hbmColor):
+                    if hbm:
+                        DeleteObject(hbm)
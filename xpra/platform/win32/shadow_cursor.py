@@ -23,11 +23,14 @@ class Win32ShadowCursorManager(ShadowCursorManager):
     def __init__(self, server=None):
         super().__init__(server)
         self.cursor_handle = None
+        # re-used for every call to `GetCursorInfo`:
+        self.cursor_info = CURSORINFO()
+        self.cursor_info.cbSize = sizeof(CURSORINFO)
+        self.cursor_info_ref = byref(self.cursor_info)
 
     def do_get_cursor_data(self) -> tuple | None:
-        ci = CURSORINFO()
-        ci.cbSize = sizeof(CURSORINFO)
-        GetCursorInfo(byref(ci))
+        ci = self.cursor_info
+        GetCursorInfo(self.cursor_info_ref)
         # cursorlog("GetCursorInfo handle=%#x, last handle=%#x", ci.hCursor or 0, self.cursor_handle or 0)
         if not (ci.flags & win32con.CURSOR_SHOWING):
             # cursorlog("do_get_cursor_data() cursor not shown")
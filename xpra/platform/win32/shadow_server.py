@@ -25,7 +25,7 @@ from xpra.log import Logger
 
 # user32:
 from xpra.platform.win32.common import (
-    EnumWindows, EnumWindowsProc, FindWindowA, IsWindowVisible,
+    enum_windows, FindWindowA, IsWindowVisible,
     GetWindowTextLengthW, GetWindowTextW,
     GetWindowRect,
     GetWindowThreadProcessId,
@@ -646,7 +646,7 @@ class ShadowServer(ShadowServerBase):
             if self.capture not in self._captures:
                 self._captures.append(self.capture)
         ourpid = os.getpid()
-        taskbar = FindWindowA("Shell_TrayWnd", None)
+        taskbar = FindWindowA(b"Shell_TrayWnd", None)
         windows: dict[int, tuple[str, tuple[int, int, int, int]]] = {}
 
         def enum_windows_cb(hwnd, lparam):
@@ -682,7 +682,7 @@ class ShadowServer(ShadowServerBase):
             windows[hwnd] = (window_title, (left, top, w, h))
             return True
 
-        EnumWindows(EnumWindowsProc(enum_windows_cb), 0)
+        enum_windows(enum_windows_cb)
         log("makeDynamicWindowModels() windows=%s", windows)
         models = []
 
@@ -23,16 +23,19 @@ class WindowPropertyFilter:
         return window.get_property(self.property_name)
 
     def matches(self, window):
+        debug = log.is_debug_enabled()
         w = self.get_window(window)
-        log("get_window(%s)=%s", window, w)
+        if debug:
+            log("get_window(%s)=%s", window, w)
         try:
             v = self.get_window_value(w)
-            log("%s.matches(%s) %s(..)=%s", self, w, self.get_window_value, v)
         except Exception:
             log("%s.matches(%s) %s(..) error:", self, w, self.get_window_value, exc_info=True)
             return False
         e = self.evaluate(v)
-        log("%s.evaluate(%s)=%s (window(%s)=%s)", self, v, e, window, w)
+        if debug:
+            log("%s.matches(%s) %s(..)=%s", self, w, self.get_window_value, v)
+            log("%s.evaluate(%s)=%s (window(%s)=%s)", self, v, e, window, w)
         return e
 
     def evaluate(self, window_value):
@@ -40,14 +43,28 @@ class WindowPropertyFilter:
 
 
 class WindowPropertyIn(WindowPropertyFilter):
-    __slots__ = ()
+    __slots__ = ("coerce_str", "value_set")
+
+    def __init__(self, property_name, value, recurse=False):
+        super().__init__(property_name, value, recurse)
+        try:
+            self.value_set = frozenset(value)
+        except TypeError:
+            # unhashable filter values, use list membership instead:
+            self.value_set = None
+        # if all the values are strings, the window value will be coerced to match:
+        self.coerce_str = {type(x) for x in value} == {str}
 
     def evaluate(self, window_value):
-        vtypes = set([type(x) for x in self.value])
-        if len(vtypes) == 1 and list(vtypes)[0] is str:
-            # coerce value to match:
+        if self.coerce_str:
             window_value = str(window_value)
-        return window_value in self.value
+        if self.value_set is None:
+            return window_value in self.value
+        try:
+            return window_value in self.value_set
+        except TypeError:
+            # unhashable window value:
+            return window_value in self.value
 
     def __repr__(self):
         return f"WindowPropertyIn({self.property_name}={self.value}, recurse={self.recurse})"
@@ -57,21 +74,65 @@ class WindowPropertyNotIn(WindowPropertyIn):
     __slots__ = ()
 
     def evaluate(self, window_value):
-        return not super().evaluate(window_value)
+        if self.coerce_str:
+            window_value = str(window_value)
+        if self.value_set is None:
+            return window_value not in self.value
+        try:
+            return window_value not in self.value_set
+        except TypeError:
+            return window_value not in self.value
 
     def __repr__(self):
         return f"WindowPropertyNotIn({self.property_name}={self.value}, recurse={self.recurse})"
 
 
+class WindowPropertyEquals(WindowPropertyFilter):
+    """
+    Same as `WindowPropertyIn` for a single value,
+    using a direct comparison so the value does not need to be hashable
+    """
+    __slots__ = ("coerce_str", "match_value")
+
+    def __init__(self, property_name, value, recurse=False):
+        super().__init__(property_name, value, recurse)
+        self.match_value = value[0]
+        # if the value is a string, the window value will be coerced to match:
+        self.coerce_str = isinstance(self.match_value, str)
+
+    def evaluate(self, window_value):
+        if self.coerce_str:
+            window_value = str(window_value)
+        return window_value == self.match_value
+
+    def __repr__(self):
+        return f"WindowPropertyEquals({self.property_name}={self.match_value}, recurse={self.recurse})"
+
+
+class WindowPropertyNotEquals(WindowPropertyEquals):
+    """
+    Same as `WindowPropertyNotIn` for a single value
+    """
+    __slots__ = ()
+
+    def evaluate(self, window_value):
+        if self.coerce_str:
+            window_value = str(window_value)
+        return window_value != self.match_value
+
+    def __repr__(self):
+        return f"WindowPropertyNotEquals({self.property_name}={self.match_value}, recurse={self.recurse})"
+
+
 def get_window_filter(object_name, property_name, operator, value):
     oname = object_name.lower()
     if oname not in ("window", "window-parent"):
         raise ValueError("invalid object name '%s'" % object_name)
     recurse = oname == "window-parent"
     if operator == "=":
-        window_filter = WindowPropertyIn(property_name, [value], recurse)
+        window_filter = WindowPropertyEquals(property_name, [value], recurse)
     elif operator == "!=":
-        window_filter = WindowPropertyNotIn(property_name, [value], recurse)
+        window_filter = WindowPropertyNotEquals(property_name, [value], recurse)
     else:
         raise ValueError("invalid window filter operator: %s" % operator)
     log("get_window_filter%s=%s", (object_name, property_name, operator, value), window_filter)
@@ -30,19 +30,17 @@ INC_VALUES = (16, 32, 64, 128, 256)
 
 def get_legacy_size_hints(screen_sizes: Sequence[tuple[int, int]]) -> dict[str, tuple[int, int]]:
     size_hints = {}
-    # find the maximum size supported:
-    max_size: dict[int, tuple[int, int]] = {}
-    for tw, th in screen_sizes:
-        max_size[tw * th] = (tw, th)
-    max_pixels = sorted(max_size.keys())[-1]
-    size_hints["maximum-size"] = max_size[max_pixels]
+    # find the maximum size supported,
+    # (the last one listed if more than one size has the same number of pixels)
+    tw, th = max(reversed(screen_sizes), key=lambda size: size[0] * size[1])
+    size_hints["maximum-size"] = (tw, th)
     # find the best increment we can use:
+    sizes_set = frozenset((tw, th) for tw, th in screen_sizes)
     inc_hits = {}
     for inc in INC_VALUES:
         hits = 0
-        for tsize in screen_sizes:
-            tw, th = tsize
-            if (tw + inc, th + inc) in screen_sizes:
+        for tw, th in screen_sizes:
+            if (tw + inc, th + inc) in sizes_set:
                 hits += 1
         inc_hits[inc] = hits
     screenlog("size increment hits: %s", inc_hits)
@@ -142,11 +140,13 @@ class ScreenDesktopModel(DesktopModelBase):
         self._screen_size_changed()
 
     def _screen_size_changed(self):
+        if not self.update_size():
+            # duplicate event, the pixmap is still valid:
+            return
         self.invalidate_pixmap()
-        if self.update_size():
-            screenlog("screen size changed: new size %ix%i", self.width, self.height)
-            self.update_size_hints()
-            self.emit("resized")
+        screenlog("screen size changed: new size %ix%i", self.width, self.height)
+        self.update_size_hints()
+        self.emit("resized")
 
     def update_size_hints(self) -> None:
         screenlog("screen dimensions: %ix%i", self.width, self.height)